@@ -4,21 +4,115 @@ class Scanner
 
 import re
 import os
-import inspect
+import sys
+import fnmatch
 import importlib
 
-from logging import Logger
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger, DEBUG
 from types import ModuleType
-from typing import Dict, Callable, Optional, Text, Union, Any
-from os.path import splitext
+from typing import (
+    Dict, Callable, Optional, Text, Union, Any, Iterable, Iterator, List, Set,
+    Tuple,
+)
 
 from appyratus.files.json import Json
-from appyratus.utils.dict_utils import DictObject
 from appyratus.logging import ConsoleLoggerInterface
 
 INIT_MODULE_NAME = '__init__.py'
 DOT_FILE_NAME = '.looksee'
 PY_EXTENSION = 'py'
+PY_SUFFIX = '.' + PY_EXTENSION
+DEFAULT_IGNORE_DIRS = frozenset(
+    {'node_modules', '.git', '__pycache__', '.venv'}
+)
+
+
+def _cached_import(mod_path: Text, _modules: Dict = sys.modules) -> ModuleType:
+    """
+    Import a module by dotted path, returning it straight out of sys.modules
+    when already imported, bypassing the import machinery. A module that is
+    still being initialized, possibly by another thread, is left to the
+    import machinery, which waits for it to finish.
+    """
+    module = _modules.get(mod_path)
+    if module is None or getattr(
+        getattr(module, '__spec__', None), '_initializing', False
+    ):
+        return importlib.import_module(mod_path)
+    return module
+
+
+_TRIVIAL_PREDICATE_CODE = (lambda obj: True).__code__
+
+
+def _is_trivial_predicate(predicate: Optional[Callable]) -> bool:
+    """
+    Determine if a predicate is absent or equivalent to `lambda obj: True`,
+    matching everything, in which case it need not be called at all.
+    """
+    if predicate is None:
+        return True
+    code = getattr(predicate, '__code__', None)
+    return (
+        code is not None
+        and code.co_code == _TRIVIAL_PREDICATE_CODE.co_code
+        and code.co_consts == _TRIVIAL_PREDICATE_CODE.co_consts
+    )
+
+
+def _load_module(mod_path: Text, reload: bool = False) -> ModuleType:
+    """
+    Import a module by dotted path. If reload is set, any previously imported
+    instance of the module is discarded, and the module is imported afresh
+    from its (presumably changed) file. Unlike importlib.reload, this leaves
+    no names behind that were removed from the file.
+    """
+    if reload:
+        sys.modules.pop(mod_path, None)
+        return importlib.import_module(mod_path)
+    return _cached_import(mod_path)
+
+
+def _is_same_context(a: Dict, b: Dict) -> bool:
+    """
+    Determine if two context dicts contain the same keys, mapped to the very
+    same objects. Values are compared by identity, as comparing arbitrary
+    objects for equality can be expensive or even raise.
+    """
+    return a.keys() == b.keys() and all(a[k] is b[k] for k in a)
+
+
+def _resolve_package_dir(
+    package: Text, root_module_file: Text
+) -> Tuple[Text, Text, Text]:
+    """
+    Get the directory containing a package's root module, the parent directory
+    of the package and the root module's file name.
+    """
+    package_dir, root_filename = os.path.split(root_module_file)
+    if package_dir.startswith('./'):
+        # ensure we use an absolute path for the package dir
+        # to prevent strange string truncation results below
+        package_dir = os.path.realpath(package_dir)
+
+    # ascend one directory per component of the dotted package path
+    package_parent_dir = package_dir
+    for _ in range(package.count('.') + 1):
+        package_parent_dir = os.path.dirname(package_parent_dir)
+
+    return package_dir, package_parent_dir, root_filename
+
+
+@lru_cache(maxsize=64)
+def _compile_globs(globs: Tuple[Text, ...]) -> re.Pattern:
+    """
+    Compile a sequence of glob patterns into a single regular expression that
+    matches any of them.
+    """
+    return re.compile('|'.join(fnmatch.translate(glob) for glob in globs))
 
 
 class Scanner:
@@ -36,134 +130,622 @@ class Scanner:
 
     def __init__(
         self,
-        predicate: Callable = lambda obj: True,
-        callback: Callable = lambda obj: None,
+        predicate: Optional[Union[Callable, Dict]] = lambda obj: True,
+        callback: Optional[Callable] = None,
         log: Optional[Logger] = None,
+        max_workers: Optional[int] = None,
+        skip_dunder: bool = True,
+        skip_modules: bool = True,
+        ignore_dirs: Iterable[Text] = DEFAULT_IGNORE_DIRS,
+        batch_callback: Optional[Callable] = None,
     ):
-        self.static_context: DictObject = DictObject()
-        self.context = self.static_context.copy()
+        self.static_context: Dict = {}
+        self.context: Dict = self.static_context.copy()
 
         # replace class-level logger
         if log is not None:
             self.log = log
 
+        # compile predicate patterns, like {'type': dict, 'has_keys': ['id']}
+        if isinstance(predicate, dict):
+            predicate = self.compile_predicate(predicate)
+
         self._predicate = predicate
+        self._predicate_is_trivial = _is_trivial_predicate(predicate)
+
+        # when set, called once per module with a list of all (name, object)
+        # tuples matched therein, instead of calling callback for each one.
+        if callback is not None and batch_callback is not None:
+            raise ValueError('pass either callback or batch_callback, not both')
+        if callback is None:
+            callback = lambda name, obj, context: None
+
         self._callback = callback
+        self._batch_callback = batch_callback
+
+        # number of threads used to import modules concurrently. When unset,
+        # modules are imported serially in the calling thread.
+        self._max_workers = max_workers
+
+        # when set, dunder attributes and module objects (i.e. those imported
+        # into a scanned module) are skipped without running the predicate.
+        self._skip_dunder = skip_dunder
+        self._skip_modules = skip_modules
+
+        # single function that decides whether a module attribute matches
+        self._filter = self._build_filter()
+
+        # names of directories that are never walked
+        self._ignore_dirs = frozenset(ignore_dirs)
+
+        # resolved package directories, keyed by dotted package path, as a
+        # tuple of the root module file they were resolved from and the
+        # return value of _resolve_package_dir
+        self._package_dirs: Dict[
+            Text, Tuple[Text, Tuple[Text, Text, Text]]
+        ] = {}
+
+        # parsed .looksee files, keyed by file path, as a tuple of the file's
+        # modification time and its parsed data
+        self._dot_file_cache: Dict[Text, Tuple[int, Dict]] = {}
+
+        # dotted path and fingerprint, being the modification time and size,
+        # of each module file, keyed by file path, as of the last scan that
+        # found it
+        self._file_fingerprints: Dict[
+            Text, Tuple[Text, Tuple[int, int]]
+        ] = {}
+
+        # dotted paths of imported modules whose files have changed since
+        # they were imported, which must be reloaded when next imported
+        self._stale_modules: Set[Text] = set()
+
+        # memoized result of the last scan of each package, keyed by dotted
+        # package path, as a tuple of the initial runtime context, the
+        # fingerprints of the module files scanned, and the resulting context
+        self._package_scans: Dict[Text, Tuple[Dict, Dict, Dict]] = {}
+
+        # dotted paths of modules that failed to import in a prior scan, which
+        # are skipped by subsequent scans rather than reimported and relogged.
+        self._failed_imports: frozenset = frozenset()
+
+    @staticmethod
+    def compile_predicate(pattern: Dict) -> Callable:
+        """
+        Compile a predicate function from a simple pattern dict. Supported
+        keys are "type", a type (or tuple of types) that objects must be an
+        instance of, and "has_keys", a key (or list of keys) that objects
+        must contain, in which case "type" defaults to dict. For example, the
+        pattern {'type': dict, 'has_keys': ['public_id']} compiles to the
+        equivalent of `lambda obj: isinstance(obj, dict) and 'public_id' in
+        obj`, with each operand bound as a local variable of the generated
+        function.
+        """
+        unrecognized = set(pattern) - {'type', 'has_keys'}
+        if unrecognized:
+            raise ValueError(
+                f'unrecognized predicate pattern keys: {sorted(unrecognized)}'
+            )
+
+        keys = pattern.get('has_keys', ())
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        obj_type = pattern.get('type', dict if keys else None)
+
+        bindings = {}
+        terms = []
+        if obj_type is not None:
+            bindings['_type'] = obj_type
+            terms.append('isinstance(obj, _type)')
+        for i, key in enumerate(keys):
+            bindings[f'_key{i}'] = key
+            terms.append(f'_key{i} in obj')
+
+        params = ''.join(f', {name}={name}' for name in bindings)
+        source = f'lambda obj{params}: {" and ".join(terms) or "True"}'
+        code = compile(source, '<looksee predicate>', 'eval')
+        namespace = {'__builtins__': {'isinstance': isinstance}, **bindings}
+        return eval(code, namespace)
 
     def scan(
         self,
         package: Text,
-        context: Optional[Union[Dict, DictObject]] = None,
-    ):
+        context: Optional[Dict] = None,
+        force: bool = False,
+    ) -> Dict:
         """
         Walk the filesystem relative to a python package, specified as a
         dotted path. For each object in each module therein, apply a
         predicate and, if True, execute a callback, like setting a value in
-        self.context.
-        """
-        # prepare the initial runtime context dict by merging any new context
-        # into a copy of the scanner's static context.
-        raw_context = self.static_context.to_dict()
-        if context:
-            raw_context.update(context)
+        self.context. The context passed into the callback, and returned, is
+        a plain dict.
 
+        The result of scanning a package is memoized, along with the
+        modification time and size of each module file therein. Unless force
+        is set, if no module file has been changed, added or removed since
+        the package was last scanned with the same context, the memoized
+        result is returned without importing or scanning anything.
+        Otherwise, the package is scanned from scratch, reloading imported
+        modules whose files have changed. Modules that failed to import in a
+        prior scan are skipped until their files change, unless force is set.
+        """
         # computed runtime context to pass into self.process:
-        runtime_context: DictObject = DictObject(raw_context)
+        runtime_context = self._new_runtime_context(context)
+        initial_context = runtime_context.copy()
 
-        root_module = importlib.import_module(package)
-        root_filename = os.path.basename(root_module.__file__)
-
-        # if we're inside a package with an __init__.py file, scan
-        # it as a module. Otherwise, scan the files in the directory
-        # containing the file.
-        if root_filename != INIT_MODULE_NAME:
-            self.scan_module(root_module, runtime_context)
+        module_files = self._find_module_files(package)
+        if module_files is None:
+            self.scan_module(_cached_import(package), runtime_context)
         else:
-            # scan the directory...
-            # get information regarding our location in the filesystem
-            package_dir = os.path.split(root_module.__file__)[0]
-            if re.match(r'\./', package_dir):
-                # ensure we use an absolute path for the package dir
-                # to prevent strange string truncation results below
-                package_dir = os.path.realpath(package_dir)
-
-            package_path_len = package.count('.') + 1
-            package_parent_dir = '/' + '/'.join(
-                package_dir.strip('/').split('/')[:-package_path_len]
+            fingerprints = {path: fp for _, path, fp in module_files}
+
+            prior_scan = self._package_scans.get(package)
+            if not force and prior_scan is not None:
+                prior_context, prior_fingerprints, prior_result = prior_scan
+                if (
+                    fingerprints == prior_fingerprints
+                    and _is_same_context(initial_context, prior_context)
+                ):
+                    self.context = prior_result.copy()
+                    return self.context.copy()
+
+            modules = self._import_modules(
+                (mod_path for mod_path, _, _ in module_files),
+                runtime_context,
+                skip_failed=not force,
             )
+            for module in modules:
+                self.scan_module(module, runtime_context)
 
-            # walk the filesystem relative to our CWD
-            for dir_name, sub_dirs, file_names in os.walk(package_dir):
-                file_names = set(file_names)
-
-                # check local .ravel file to see if we should skip this
-                # directory.
-                if DOT_FILE_NAME in file_names:
-                    dot_file_path = os.path.join(dir_name, DOT_FILE_NAME)
-                    dot_data = Json.read(dot_file_path) or {}
-                    ignore = dot_data.get('ignore', False)
-                    if ignore:
-                        self.on_ignore_directory(os.path.realpath(dir_name))
-                        sub_dirs.clear()
-                        continue
-
-                # scan files in the package directory
-                if INIT_MODULE_NAME in file_names:
-                    dir_name_offset = len(package_parent_dir)
-
-                    # compute the dotted package path, derived from the filepath
-                    pkg_path = dir_name[dir_name_offset + 1:].replace("/", ".")
-                    for file_name in file_names:
-                        if not file_name.endswith('.' + PY_EXTENSION):
-                            continue
-
-                        # compute dotted module path
-                        mod_path = f'{pkg_path}.{splitext(file_name)[0]}'
-                        try:
-                            module = importlib.import_module(mod_path)
-                        except Exception as exc:
-                            self.on_import_error(exc, mod_path, runtime_context)
-                            continue
-
-                        # scan the module in the package directory
-                        self.scan_module(module, runtime_context)
+            self._package_scans[package] = (
+                initial_context, fingerprints, runtime_context.copy()
+            )
 
         # memoize the final context, which is the result of merging runtime
         # context generated into a copy of the static context
         self.context = runtime_context
         return self.context.copy()
 
-    def scan_module(self, module: ModuleType, context: DictObject):
+    def scan_iter(
+        self,
+        package: Text,
+        context: Optional[Dict] = None,
+    ) -> Iterator[Tuple[Text, Any]]:
+        """
+        Walk the filesystem relative to a python package, like scan, but
+        lazily generate a (name, object) tuple for each object that matches
+        the predicate instead of executing the callback. This way, the caller
+        can stop the scan early by breaking out of the loop. Like scan,
+        imported modules whose files have changed are reloaded.
+        """
+        runtime_context = self._new_runtime_context(context)
+        module_files = self._find_module_files(package)
+        if module_files is None:
+            yield from self._iter_matches(_cached_import(package))
+            return
+
+        modules = self._import_modules(
+            (mod_path for mod_path, _, _ in module_files), runtime_context
+        )
+        for module in modules:
+            yield from self._iter_matches(module)
+
+    def reset(self):
+        """
+        Forget everything memoized by prior scans, including the resulting
+        context, so that the next scan starts from scratch.
+        """
+        self.context = self.static_context.copy()
+        self._dot_file_cache.clear()
+        self._file_fingerprints.clear()
+        self._stale_modules.clear()
+        self._package_scans.clear()
+        self._failed_imports = frozenset()
+        self._package_dirs.clear()
+
+    def _get_package_dir(self, package: Text) -> Tuple[Text, Text, Text]:
+        """
+        Resolve a package's directories, as per _resolve_package_dir, reusing
+        the result of a prior call, provided that the package is still
+        imported from the same file.
+        """
+        root_module_file = _cached_import(package).__file__
+        cached = self._package_dirs.get(package)
+        if cached is not None and cached[0] == root_module_file:
+            return cached[1]
+
+        package_dirs = _resolve_package_dir(package, root_module_file)
+        self._package_dirs[package] = (root_module_file, package_dirs)
+        return package_dirs
+
+    def _new_runtime_context(self, context: Optional[Dict]) -> Dict:
+        """
+        Prepare the initial runtime context by merging any new context into a
+        copy of the scanner's static context.
+        """
+        if context:
+            return {**self.static_context, **context}
+        return self.static_context.copy()
+
+    def _find_module_files(
+        self, package: Text
+    ) -> Optional[List[Tuple[Text, Text, Tuple[int, int]]]]:
+        """
+        Find the module files to scan, relative to a python package, as per
+        _fingerprint_module_files, recording their latest fingerprints. If
+        the package is a plain module rather than a package with an
+        __init__.py file, there are no module files to find and None is
+        returned, in which case the module itself is to be scanned.
+        """
+        # get information regarding our location in the filesystem
+        package_dir, package_parent_dir, root_filename = (
+            self._get_package_dir(package)
+        )
+        if root_filename != INIT_MODULE_NAME:
+            return None
+
+        # walk the filesystem relative to our CWD, listing each module in the
+        # order that it was discovered.
+        module_files = self._fingerprint_module_files(
+            package_dir, package_parent_dir
+        )
+        self._update_file_fingerprints(package_dir, module_files)
+        return module_files
+
+    def _iter_module_files(
+        self, package_dir: Text, package_parent_dir: Text
+    ) -> Iterator[Tuple[Text, os.DirEntry]]:
+        """
+        Generate the dotted path and directory entry of each Python module
+        contained in a package directory, recursively.
+        """
+        # values that are invariant across directories in the walk
+        dir_name_offset = len(package_parent_dir) + 1
+        ext_len = len(PY_SUFFIX)
+        ignore_re = self._get_ignore_regex(package_dir)
+
+        walk = self._walk_scandir(package_dir, ignore_re)
+        for dir_name, py_files, has_init in walk:
+            # scan files in the package directory
+            if has_init:
+                # compute the dotted package path, derived from the filepath
+                pkg_path = dir_name[dir_name_offset:].replace("/", ".")
+                for entry in py_files:
+                    # compute dotted module path
+                    mod_path = sys.intern(f'{pkg_path}.{entry.name[:-ext_len]}')
+                    yield mod_path, entry
+
+    def _fingerprint_module_files(
+        self, package_dir: Text, package_parent_dir: Text
+    ) -> List[Tuple[Text, Text, Tuple[int, int]]]:
+        """
+        Get the dotted path, file path and fingerprint, being the modification
+        time and size, of each Python module contained in a package directory.
+        Files that vanish before they can be stat'ed are left out.
+        """
+        module_files = []
+        for mod_path, entry in self._iter_module_files(
+            package_dir, package_parent_dir
+        ):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            module_files.append((mod_path, entry.path, fingerprint))
+        return module_files
+
+    def _update_file_fingerprints(
+        self,
+        package_dir: Text,
+        module_files: List[Tuple[Text, Text, Tuple[int, int]]],
+    ) -> None:
+        """
+        Record the latest fingerprint of each module file found in a package
+        directory. Modules whose files have changed since last found are
+        marked stale, so that they're reloaded when next imported, and those
+        that previously failed to import are given another chance. Anything
+        memoized about files in the directory that no longer exist is
+        forgotten.
+        """
+        fingerprints = self._file_fingerprints
+        for mod_path, path, fingerprint in module_files:
+            prior = fingerprints.get(path)
+            if prior is None or prior[1] != fingerprint:
+                fingerprints[path] = (mod_path, fingerprint)
+                if prior is not None:
+                    self._stale_modules.add(mod_path)
+                if mod_path in self._failed_imports:
+                    self._failed_imports -= {mod_path}
+
+        # a module whose file was removed is stale, should the file reappear
+        prefix = os.path.join(package_dir, '')
+        found = {path for _, path, _ in module_files}
+        for path in [
+            path for path in fingerprints
+            if path.startswith(prefix) and path not in found
+        ]:
+            self._stale_modules.add(fingerprints.pop(path)[0])
+        for path in [
+            path for path in self._dot_file_cache
+            if path.startswith(prefix) and not os.path.exists(path)
+        ]:
+            del self._dot_file_cache[path]
+
+    def _import_modules(
+        self,
+        mod_paths: Iterable[Text],
+        context: Dict,
+        skip_failed: bool = False,
+    ) -> Iterator[ModuleType]:
+        """
+        Import each module in turn, generating them in the order given. If
+        max_workers is set, imports are performed concurrently in a thread
+        pool, keeping a bounded backlog of imports in flight ahead of the
+        consumer. Modules that fail to import trigger on_import_error and are
+        remembered, so that they can be skipped by subsequent scans if
+        skip_failed is set. Stale modules are reloaded.
+        """
+        if skip_failed:
+            mod_paths = (x for x in mod_paths if x not in self._failed_imports)
+
+        if not self._max_workers or self._max_workers < 2:
+            for mod_path in mod_paths:
+                try:
+                    module = _load_module(
+                        mod_path, mod_path in self._stale_modules
+                    )
+                except Exception as exc:
+                    self._stale_modules.discard(mod_path)
+                    self._failed_imports |= {mod_path}
+                    self.on_import_error(exc, mod_path, context)
+                    continue
+                self._stale_modules.discard(mod_path)
+                if mod_path in self._failed_imports:
+                    self._failed_imports -= {mod_path}
+                yield module
+            return
+
+        backlog_size = 4 * self._max_workers
+        backlog = deque()
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            for mod_path in mod_paths:
+                future = executor.submit(
+                    _load_module, mod_path, mod_path in self._stale_modules
+                )
+                backlog.append((mod_path, future))
+                if len(backlog) >= backlog_size:
+                    yield from self._resolve_imports(backlog, 1, context)
+            yield from self._resolve_imports(backlog, len(backlog), context)
+        finally:
+            # drop any imports still queued if the consumer stopped early
+            executor.shutdown(cancel_futures=True)
+
+    def _resolve_imports(
+        self, backlog: deque, count: int, context: Dict
+    ) -> Iterator[ModuleType]:
+        """
+        Wait on the oldest pending imports in the backlog, generating each
+        module that was imported successfully.
+        """
+        for _ in range(count):
+            mod_path, future = backlog.popleft()
+            # once resolved, a stale module has been reloaded or discarded
+            self._stale_modules.discard(mod_path)
+            try:
+                module = future.result()
+            except Exception as exc:
+                self._failed_imports |= {mod_path}
+                self.on_import_error(exc, mod_path, context)
+                continue
+            if mod_path in self._failed_imports:
+                self._failed_imports -= {mod_path}
+            yield module
+
+    def _get_ignore_regex(self, package_dir: Text) -> Optional[re.Pattern]:
+        """
+        Compile the "ignore_globs" list in the .looksee file at the root of the
+        package directory, if any, into a single regular expression.
+        """
+        dot_file_path = os.path.join(package_dir, DOT_FILE_NAME)
+        try:
+            mtime_ns = os.stat(dot_file_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        globs = self._read_dot_file(dot_file_path, mtime_ns).get('ignore_globs')
+        return _compile_globs(tuple(globs)) if globs else None
+
+    def _walk_scandir(
+        self, dir_name: Text, ignore_re: Optional[re.Pattern] = None
+    ):
+        """
+        Recursively walk the filesystem, top-down, yielding a tuple of each
+        directory path, the Python file entries it contains, and whether it
+        contains an __init__.py file. Each directory is read with a single
+        os.scandir pass, relying on the cached DirEntry type information
+        instead of stat'ing every entry. Directories ignored by way of a
+        .looksee file are pruned before recursing into them, while those in
+        ignore_dirs or matching ignore_re are never read at all. Like os.walk,
+        directories that can't be read are silently skipped.
+        """
+        ignore_dirs = self._ignore_dirs
+        py_files = []
+        sub_dirs = []
+        has_init = False
+        dot_entry = None
+
+        try:
+            entries = os.scandir(dir_name)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if ignore_re is not None and ignore_re.match(name):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if name not in ignore_dirs:
+                        sub_dirs.append(entry.path)
+                    continue
+                if name.endswith(PY_SUFFIX):
+                    py_files.append(entry)
+                    if name == INIT_MODULE_NAME:
+                        has_init = True
+                elif name == DOT_FILE_NAME:
+                    dot_entry = entry
+
+        # check local .looksee file to see if we should skip this directory.
+        if dot_entry is not None:
+            try:
+                mtime_ns = dot_entry.stat().st_mtime_ns
+            except OSError:
+                # the file was removed after the directory was listed
+                mtime_ns = None
+            if mtime_ns is not None:
+                dot_data = self._read_dot_file(dot_entry.path, mtime_ns)
+            else:
+                dot_data = {}
+            if dot_data.get('ignore', False):
+                self.on_ignore_directory(os.path.realpath(dir_name))
+                return
+
+        yield dir_name, py_files, has_init
+
+        for sub_dir in sub_dirs:
+            yield from self._walk_scandir(sub_dir, ignore_re)
+
+    def _read_dot_file(self, path: Text, mtime_ns: int) -> Dict:
+        """
+        Read and parse a .looksee file, caching the parsed data by file path
+        and modification time, so it's only parsed again if it changes.
+        """
+        cached = self._dot_file_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        dot_data = Json.read(path) or {}
+        self._dot_file_cache[path] = (mtime_ns, dot_data)
+        return dot_data
+
+    def scan_module(self, module: ModuleType, context: Dict):
         """
         Scan a loaded python Module.
         """
-        if None in module.__dict__:
-            # XXX: why is this happenings?
-            del module.__dict__[None]
+        # check the log level once per module rather than formatting a debug
+        # message for each object, only for it to be discarded.
+        debug_enabled = self._is_debug_enabled()
 
-        for k, v in inspect.getmembers(module, predicate=self.match):
+        if self._batch_callback is not None:
+            matches = list(self._iter_matches(module))
+            if matches:
+                if debug_enabled:
+                    self.log.debug(
+                        f'processing {len(matches)} objects '
+                        f'in {module.__file__}'
+                    )
+                try:
+                    self.process_batch(module, matches, context)
+                except Exception as exc:
+                    self.on_batch_callback_error(exc, module, context, matches)
+            return
+
+        for k, v in self._iter_matches(module):
+            if debug_enabled:
+                self.log.debug(f'processing {k} in {module.__file__}')
             try:
                 self.process(module, k, v, context)
             except Exception as exc:
                 self.on_callback_error(exc, module, context, k, v)
 
+    def _is_debug_enabled(self) -> bool:
+        """
+        Determine if the logger would emit debug messages. The logger may be
+        either a standard Logger or a wrapper around one, like the default
+        ConsoleLoggerInterface.
+        """
+        logger = getattr(self.log, 'logger', self.log)
+        return logger.isEnabledFor(DEBUG)
+
+    def _iter_matches(self, module: ModuleType) -> Iterator[Tuple[Text, Any]]:
+        """
+        Generate each (name, object) tuple in a module that matches the
+        predicate.
+        """
+        # iterate over a snapshot of the module's namespace directly, rather
+        # than through inspect.getmembers, which getattr's and sorts every
+        # member and goes through self.match for each one.
+        is_match = self._filter
+        for k, v in list(module.__dict__.items()):
+            if is_match(k, v):
+                # names are interned as they typically end up as context keys
+                yield sys.intern(k), v
+
+    def _build_filter(self) -> Callable[[Text, Any], bool]:
+        """
+        Fuse the None key, dunder and module checks, along with the predicate,
+        into a single function of an attribute's name and value. Disabled
+        checks are bound to empty tuples, as neither str.startswith nor
+        isinstance ever match an empty tuple. A trivial predicate, which
+        matches everything, is left out entirely. If a subclass overrides
+        match, it is used in place of the predicate.
+        """
+        predicate = self._predicate
+        is_trivial = self._predicate_is_trivial
+        if type(self).match is not Scanner.match:
+            predicate = self.match
+            is_trivial = False
+
+        dunder = '__' if self._skip_dunder else ()
+        module_type = ModuleType if self._skip_modules else ()
+
+        # stray None keys have been observed in module namespaces
+        if is_trivial:
+            return lambda k, v, _d=dunder, _m=module_type: (
+                k is not None
+                and not k.startswith(_d)
+                and not isinstance(v, _m)
+            )
+
+        return lambda k, v, _p=predicate, _d=dunder, _m=module_type: (
+            k is not None
+            and not k.startswith(_d)
+            and not isinstance(v, _m)
+            and _p(v)
+        )
+
     def match(self, obj: Any) -> bool:
         """
         Perform check to see if we should apply callbacl to the given value.
         """
+        if self._predicate_is_trivial:
+            return True
         is_match = self._predicate(obj)
         return is_match
 
     def process(
-        self, module: ModuleType, name: Text, obj: Any, context: DictObject
+        self, module: ModuleType, name: Text, obj: Any, context: Dict
     ):
         """
         Logic to execute upon self.predicate evaluating True for the given
         value.
         """
-        self.log.debug(f'processing {name} in {module.__file__}')
         self._callback(name, obj, context)
 
+    def process_batch(
+        self, module: ModuleType, matches: List[Tuple[Text, Any]], context: Dict
+    ):
+        """
+        Logic to execute, when a batch callback is set, upon scanning a module
+        containing values for which self.predicate evaluated True.
+        """
+        self._batch_callback(matches, context)
+
     def on_ignore_directory(self, dirpath: Text):
         """
         Callback for when the scanner skips a directory because of a .looksee
@@ -172,7 +754,7 @@ class Scanner:
         self.log.info(message=f'ignoring directory: {dirpath}')
 
     def on_import_error(
-        self, exc: Exception, module_path: Text, context: DictObject
+        self, exc: Exception, module_path: Text, context: Dict
     ):
         """
         Callback that executes if the scanner can't import a module because
@@ -180,11 +762,30 @@ class Scanner:
         """
         self.log.exception(f'encountered import error in {module_path}')
 
+    def on_batch_callback_error(
+        self,
+        exc: Exception,
+        module: ModuleType,
+        context: Dict,
+        matches: List[Tuple[Text, Any]],
+    ):
+        """
+        Callback that executes if the batch callback raised an error while
+        processing the objects matched in an imported module.
+        """
+        self.log.exception(
+            message=f'scanner encountered an error while scanning module',
+            data={
+                'module': module.__name__,
+                'objects': [name for name, _ in matches],
+            }
+        )
+
     def on_callback_error(
         self,
         exc: Exception,
         module: ModuleType,
-        context: DictObject,
+        context: Dict,
         name: Text,
         obj: Any
     ):
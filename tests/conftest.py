@@ -0,0 +1,49 @@
+import sys
+import uuid
+import importlib
+
+from pathlib import Path
+
+import pytest
+
+EXAMPLE_DIR = Path(__file__).parent.parent / 'example'
+
+
+@pytest.fixture
+def make_package(tmp_path, monkeypatch):
+    """
+    Return a function that writes a uniquely named package into a temporary
+    directory on sys.path, from a dict mapping relative file paths to source
+    code, returning the package name.
+    """
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    package_names = []
+
+    def make_package(files):
+        package_name = f'pkg_{uuid.uuid4().hex}'
+        for rel_path, source in files.items():
+            path = tmp_path / package_name / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+        package_names.append(package_name)
+        importlib.invalidate_caches()
+        return package_name
+
+    yield make_package
+
+    for mod_path in list(sys.modules):
+        if mod_path.split('.')[0] in package_names:
+            del sys.modules[mod_path]
+
+
+@pytest.fixture
+def example_path(monkeypatch):
+    """
+    Put the example directory, containing the "pooply" package, on sys.path.
+    """
+    monkeypatch.syspath_prepend(str(EXAMPLE_DIR))
+    yield EXAMPLE_DIR
+    for mod_path in list(sys.modules):
+        if mod_path.split('.')[0] == 'pooply':
+            del sys.modules[mod_path]
@@ -0,0 +1,406 @@
+import os
+import sys
+import uuid
+import importlib
+import threading
+
+import pytest
+
+from looksee import Scanner
+from looksee.scanner import _cached_import
+
+
+def collect(name, obj, ctx):
+    ctx[name] = obj
+
+
+def test_scan_skips_unreadable_directory(make_package, monkeypatch):
+    package = make_package({
+        '__init__.py': '',
+        'x.py': 'X = {"public_id": 1}',
+        'locked/__init__.py': '',
+        'locked/y.py': 'Y = {"public_id": 2}',
+    })
+
+    scandir = os.scandir
+
+    def locked_scandir(path):
+        if os.path.basename(path) == 'locked':
+            raise PermissionError(13, 'Permission denied', path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', locked_scandir)
+
+    scanner = Scanner(predicate={'has_keys': ['public_id']}, callback=collect)
+    assert scanner.scan(package) == {'X': {'public_id': 1}}
+
+
+def test_dot_file_ignore_prunes_directory(make_package, tmp_path):
+    package = make_package({
+        '__init__.py': '',
+        'x.py': 'X = 1',
+        'skipped/__init__.py': '',
+        'skipped/.looksee': '{"ignore": true}',
+        'skipped/y.py': 'raise ImportError("never imported")',
+        'skipped/nested/__init__.py': '',
+        'skipped/nested/z.py': 'Z = 3',
+    })
+    ignored = []
+
+    class RecordingScanner(Scanner):
+        def on_ignore_directory(self, dirpath):
+            ignored.append(dirpath)
+
+        def on_import_error(self, exc, module_path, context):
+            raise exc
+
+    scanner = RecordingScanner(predicate={'type': int}, callback=collect)
+    assert scanner.scan(package) == {'X': 1}
+    assert ignored == [os.path.realpath(tmp_path / package / 'skipped')]
+
+
+def test_failed_import_is_retried_by_scan_iter_and_forced_scan(
+    make_package, tmp_path
+):
+    package = make_package({
+        '__init__.py': '',
+        'bad.py': 'raise ImportError("boom")',
+    })
+    scanner = Scanner(predicate={'has_keys': ['public_id']}, callback=collect)
+    assert scanner.scan(package) == {}
+
+    # fix the module
+    (tmp_path / package / 'bad.py').write_text('Z = {"public_id": 9}')
+
+    assert list(scanner.scan_iter(package)) == [('Z', {'public_id': 9})]
+    assert scanner.scan(package, force=True) == {'Z': {'public_id': 9}}
+
+
+def test_cached_import_waits_for_module_being_initialized(make_package):
+    package = make_package({
+        '__init__.py': '',
+        'gate.py': (
+            'import threading\n'
+            'started = threading.Event()\n'
+            'release = threading.Event()\n'
+        ),
+        'a.py': (
+            'from . import gate\n'
+            'gate.started.set()\n'
+            'gate.release.wait(5)\n'
+            'A = 1\n'
+        ),
+    })
+    gate = importlib.import_module(f'{package}.gate')
+    importer = threading.Thread(
+        target=importlib.import_module, args=(f'{package}.a',)
+    )
+    importer.start()
+    try:
+        assert gate.started.wait(5)
+        threading.Timer(0.2, gate.release.set).start()
+        assert _cached_import(f'{package}.a').A == 1
+    finally:
+        gate.release.set()
+        importer.join()
+
+
+def test_scan_uses_overridden_match(make_package):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'A = {"public_id": 1}\nB = 2',
+    })
+
+    class IntScanner(Scanner):
+        def match(self, obj):
+            return isinstance(obj, int)
+
+    scanner = IntScanner(callback=collect)
+    assert scanner.scan(package) == {'B': 2}
+
+
+def test_default_predicate_matches_everything(make_package):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1\nB = "b"'})
+    assert Scanner(callback=collect).scan(package) == {'A': 1, 'B': 'b'}
+
+    scanner = Scanner(predicate=lambda obj: False, callback=collect)
+    assert scanner.scan(package) == {}
+
+
+def test_dunder_names_and_modules_are_skipped_by_default(make_package):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'import os\n__x__ = 5\nA = 1',
+    })
+    assert Scanner(callback=collect).scan(package) == {'A': 1}
+
+    found = Scanner(callback=collect, skip_dunder=False).scan(package)
+    assert found['__x__'] == 5
+    assert 'os' not in found
+
+    found = Scanner(callback=collect, skip_modules=False).scan(package)
+    assert found == {'os': os, 'A': 1}
+
+
+def test_scan_iter_stops_early_without_running_callback(make_package):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'A = {"public_id": 1}',
+        'b.py': 'B = {"public_id": 2}',
+    })
+    calls = []
+    scanner = Scanner(
+        predicate={'has_keys': ['public_id']},
+        callback=lambda name, obj, ctx: calls.append(name),
+    )
+
+    matches = scanner.scan_iter(package)
+    name, obj = next(matches)
+    matches.close()
+
+    assert name in ('A', 'B')
+    assert calls == []
+    assert sorted(scanner.scan_iter(package)) == [
+        ('A', {'public_id': 1}), ('B', {'public_id': 2})
+    ]
+
+
+def test_compile_predicate():
+    predicate = Scanner.compile_predicate(
+        {'type': dict, 'has_keys': ['public_id', 'name']}
+    )
+    assert predicate({'public_id': 1, 'name': 'Elon'})
+    assert not predicate({'public_id': 1})
+    assert not predicate(['public_id', 'name'])
+
+    # "type" defaults to dict when "has_keys" is given
+    assert not Scanner.compile_predicate({'has_keys': ['x']})('x')
+    assert Scanner.compile_predicate({'type': (int, str)})('x')
+    assert Scanner.compile_predicate({})(None)
+
+    # a single key may be given as a string
+    predicate = Scanner.compile_predicate({'has_keys': 'public_id'})
+    assert predicate({'public_id': 1})
+    assert not predicate({'p': 1, 'u': 2, 'b': 3, 'l': 4, 'i': 5, 'c': 6})
+
+
+def test_compile_predicate_rejects_unrecognized_keys():
+    with pytest.raises(ValueError):
+        Scanner.compile_predicate({'tpye': dict})
+
+
+def test_scan_with_pattern_predicate(example_path):
+    scanner = Scanner(predicate={'has_keys': ['public_id']}, callback=collect)
+    assert sorted(scanner.scan('pooply')) == [
+        'elon', 'jesus', 'poseidon', 'spacex'
+    ]
+
+
+def test_ignore_dirs_and_globs_prune_the_walk(make_package, monkeypatch):
+    package = make_package({
+        '.looksee': '{"ignore_globs": ["build*", "*_generated.py"]}',
+        '__init__.py': '',
+        'a.py': 'A = {"public_id": 1}',
+        'a_generated.py': 'G = {"public_id": 2}',
+        'build_out/__init__.py': '',
+        'build_out/b.py': 'B = {"public_id": 3}',
+        'vendor/__init__.py': '',
+        'vendor/v.py': 'V = {"public_id": 4}',
+        'node_modules/__init__.py': '',
+        'node_modules/n.py': 'N = {"public_id": 5}',
+    })
+
+    scandir = os.scandir
+    scanned_dirs = []
+
+    def recording_scandir(path):
+        scanned_dirs.append(os.path.basename(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', recording_scandir)
+
+    scanner = Scanner(
+        predicate={'has_keys': ['public_id']},
+        callback=collect,
+        ignore_dirs={'vendor', 'node_modules'},
+    )
+    assert scanner.scan(package) == {'A': {'public_id': 1}}
+    assert scanned_dirs == [package]
+
+
+def test_rescanning_a_different_package_does_not_merge_results(example_path):
+    scanner = Scanner(predicate={'has_keys': ['public_id']}, callback=collect)
+    assert sorted(scanner.scan('pooply')) == [
+        'elon', 'jesus', 'poseidon', 'spacex'
+    ]
+    assert sorted(scanner.scan('pooply.accounts')) == ['spacex']
+    assert sorted(scanner.context) == ['spacex']
+
+
+def test_context_does_not_carry_into_the_next_scan(make_package):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1'})
+    scanner = Scanner(predicate={'type': int}, callback=collect)
+    assert scanner.scan(package, context={'extra': True}) == {
+        'extra': True, 'A': 1
+    }
+    assert scanner.scan(package) == {'A': 1}
+
+
+def test_unchanged_package_is_not_rescanned(make_package):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1'})
+    calls = []
+
+    def callback(name, obj, ctx):
+        calls.append(name)
+        ctx[name] = obj
+
+    scanner = Scanner(predicate={'type': int}, callback=callback)
+    assert scanner.scan(package) == {'A': 1}
+    assert scanner.scan(package) == {'A': 1}
+    assert calls == ['A']
+
+    assert scanner.scan(package, force=True) == {'A': 1}
+    assert calls == ['A', 'A']
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_rescan_reloads_changed_modules_and_drops_stale_results(
+    make_package, tmp_path, max_workers
+):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'A = 1\nOLD = 2',
+        'b.py': 'B = 3',
+    })
+    scanner = Scanner(
+        predicate={'type': int}, callback=collect, max_workers=max_workers
+    )
+    assert scanner.scan(package) == {'A': 1, 'OLD': 2, 'B': 3}
+
+    (tmp_path / package / 'a.py').write_text('A = 100\nNEW = 4')
+    (tmp_path / package / 'b.py').unlink()
+
+    assert scanner.scan(package) == {'A': 100, 'NEW': 4}
+    assert scanner.context == {'A': 100, 'NEW': 4}
+
+
+@pytest.mark.parametrize('max_workers', [None, 4])
+def test_scan_iter_reloads_changed_modules(make_package, tmp_path, max_workers):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1'})
+    scanner = Scanner(predicate={'type': int}, max_workers=max_workers)
+    assert dict(scanner.scan_iter(package)) == {'A': 1}
+
+    (tmp_path / package / 'a.py').write_text('A = 2\nB = 3')
+
+    assert dict(scanner.scan_iter(package)) == {'A': 2, 'B': 3}
+
+
+def test_rescan_forgets_removed_files(make_package, tmp_path):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'A = 1',
+        'sub/__init__.py': '',
+        'sub/.looksee': '{}',
+        'sub/b.py': 'B = 2',
+    })
+    scanner = Scanner(predicate={'type': int}, callback=collect)
+    assert scanner.scan(package) == {'A': 1, 'B': 2}
+
+    (tmp_path / package / 'sub' / '.looksee').unlink()
+    (tmp_path / package / 'sub' / 'b.py').unlink()
+    assert scanner.scan(package) == {'A': 1}
+    assert scanner._dot_file_cache == {}
+    assert len(scanner._file_fingerprints) == 3
+
+    # a module whose file reappears is reloaded, rather than reused
+    (tmp_path / package / 'sub' / 'b.py').write_text('B = 4')
+    assert scanner.scan(package) == {'A': 1, 'B': 4}
+
+
+def test_reset_forgets_memoized_scans(make_package):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1'})
+    calls = []
+
+    def callback(name, obj, ctx):
+        calls.append(name)
+        ctx[name] = obj
+
+    scanner = Scanner(predicate={'type': int}, callback=callback)
+    scanner.scan(package)
+    scanner.reset()
+    assert scanner.context == {}
+    assert scanner.scan(package) == {'A': 1}
+    assert calls == ['A', 'A']
+
+
+def test_batch_callback_is_called_once_per_module(make_package):
+    package = make_package({
+        '__init__.py': '',
+        'a.py': 'A = 1\nB = 2',
+    })
+    batches = []
+
+    def batch_callback(matches, ctx):
+        batches.append(matches)
+        ctx.update(matches)
+
+    scanner = Scanner(predicate={'type': int}, batch_callback=batch_callback)
+    assert scanner.scan(package) == {'A': 1, 'B': 2}
+    assert batches == [[('A', 1), ('B', 2)]]
+
+
+def test_batch_callback_error_hook(make_package):
+    package = make_package({'__init__.py': '', 'a.py': 'A = 1'})
+    errors = []
+
+    class RecordingScanner(Scanner):
+        def on_batch_callback_error(self, exc, module, context, matches):
+            errors.append((type(exc), module.__name__, matches))
+
+    def batch_callback(matches, ctx):
+        raise RuntimeError()
+
+    scanner = RecordingScanner(
+        predicate={'type': int}, batch_callback=batch_callback
+    )
+    assert scanner.scan(package) == {}
+    assert errors == [(RuntimeError, f'{package}.a', [('A', 1)])]
+
+
+def test_callback_and_batch_callback_are_mutually_exclusive():
+    with pytest.raises(ValueError):
+        Scanner(callback=collect, batch_callback=lambda matches, ctx: None)
+
+
+def test_package_dir_follows_package_across_directories(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    package = f'pkg_{uuid.uuid4().hex}'
+    for dir_name, source in [('d1', 'A = 1'), ('d2', 'B = 2')]:
+        (tmp_path / dir_name / package).mkdir(parents=True)
+        (tmp_path / dir_name / package / '__init__.py').write_text('')
+        (tmp_path / dir_name / package / 'mod.py').write_text(source)
+
+    def unimport():
+        for mod_path in list(sys.modules):
+            if mod_path.split('.')[0] == package:
+                del sys.modules[mod_path]
+
+    def import_from(dir_name):
+        unimport()
+        monkeypatch.syspath_prepend(str(tmp_path / dir_name))
+        importlib.invalidate_caches()
+
+    try:
+        scanner = Scanner(predicate={'type': int}, callback=collect)
+        import_from('d1')
+        assert scanner.scan(package) == {'A': 1}
+
+        import_from('d2')
+        assert scanner.scan(package) == {'B': 2}
+        assert Scanner(predicate={'type': int}, callback=collect).scan(
+            package
+        ) == {'B': 2}
+    finally:
+        unimport()